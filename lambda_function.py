@@ -32,6 +32,10 @@ TOP_GAINING_POOLS_LINK = "https://dexscreener.com/solana?rankBy=priceChangeH24&o
 TRENDING_POOLS_LINK = "https://dexscreener.com/solana?rankBy=trendingScoreH6&order=desc"
 NEWEST_POOLS_LINK = "https://dexscreener.com/solana?rankBy=volume&order=desc&maxAge=24"
 
+# the lambda runtime installs a root handler, so basicConfig alone is a no-op there
+logging.basicConfig(level=logging.INFO)
+logging.getLogger().setLevel(logging.INFO)
+
 
 def main():
     sol_usd = YFinanceApi.get_sol_usd_price()
@@ -181,6 +185,10 @@ def main():
 
     lark_client = LarkClient(key=LARK_KEY)
     lark_client.send_card(header=header_element, elements=elements)
+    logging.info(
+        f"card payload: {lark_client.payload_size} bytes, "
+        f"encoded in {lark_client.encode_time * 1000:.2f}ms"
+    )
 
 
 def lambda_handler(event=None, context=None):
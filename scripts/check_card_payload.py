@@ -0,0 +1,109 @@
+"""Check LarkClient's card payload encoding against requests' json= body.
+
+Usage: python scripts/check_card_payload.py
+"""
+
+import os
+import sys
+import json
+import time
+import pandas as pd
+from requests.models import PreparedRequest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from solbot import LarkClient as lark_module
+from solbot.utils import human_readable_format
+from solbot.LarkClient import (
+    LarkClient,
+    dumps,
+    HREF,
+    GREY,
+    RED,
+    GREEN,
+    HORIZONTAL_LINE_ELEMENT,
+)
+
+N = 2000
+
+
+def price_change_formatter(price_change):
+    if price_change is None:
+        return GREY("-")
+    color_fmt = GREY if price_change == 0 else RED if price_change < 0 else GREEN
+    return color_fmt(human_readable_format(abs(price_change)) + "%")
+
+
+row_elem_formatters = {x: price_change_formatter for x in ("5m", "1h", "6h", "24h")}
+
+
+def build_card():
+    trending_df = pd.DataFrame([{"5m": 0.12, "1h": -1.5, "6h": 23.4, "24h": None}])
+    gainers_df = pd.DataFrame(
+        [
+            {"Pool": HREF("A/SOL", "https://solscan.io/account/a"), "Dex": "Raydium", "24h": 1234.5},
+            {"Pool": HREF("B/SOL", "https://solscan.io/account/b"), "Dex": "Orca", "24h": None},
+            {"Pool": HREF("C/SOL", "https://solscan.io/account/c"), "Dex": "Raydium", "24h": -0.0},
+        ]
+    )
+    elements = [
+        LarkClient.generate_markdown_element("**🔥 Trending Pools**"),
+        LarkClient.generate_markdown_element("**🥇: A/SOL**\n**Dex**: Raydium"),
+        LarkClient.generate_table_element(
+            trending_df, row_elem_formatters=row_elem_formatters
+        ),
+        HORIZONTAL_LINE_ELEMENT,
+        LarkClient.generate_markdown_element("**🚀 Top Gainers**"),
+        LarkClient.generate_table_element(
+            gainers_df, row_elem_formatters=row_elem_formatters, width="auto"
+        ),
+    ]
+    return {
+        "msg_type": "interactive",
+        "card": {
+            "elements": elements,
+            "header": LarkClient.generate_header_element("Sol Bot Daily", "wathet"),
+        },
+    }
+
+
+def requests_body(data) -> bytes:
+    """Body requests.post(json=data) sends"""
+    request = PreparedRequest()
+    request.prepare_headers({})
+    request.prepare_body(data=None, files=None, json=data)
+    return request.body
+
+
+def check_outputs(card):
+    expected = json.loads(requests_body(card))
+    assert json.loads(dumps(card)) == expected
+    orjson, lark_module.orjson = lark_module.orjson, None
+    try:
+        assert json.loads(dumps(card)) == expected
+    finally:
+        lark_module.orjson = orjson
+
+
+def bench(encode, card):
+    start = time.perf_counter()
+    for _ in range(N):
+        encode(card)
+    return time.perf_counter() - start
+
+
+def main():
+    card = build_card()
+    check_outputs(card)
+    print("payload matches requests' json= body")
+
+    # what requests.post(json=...) runs to build the body
+    baseline = bench(lambda c: json.dumps(c, allow_nan=False).encode("utf-8"), card)
+    encoded = bench(dumps, card)
+    encoder = "orjson" if lark_module.orjson is not None else "json"
+    print(f"requests json=: {baseline:.3f}s, dumps ({encoder}): {encoded:.3f}s")
+    print(f"for {N} encodes of a {len(dumps(card))} byte card")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,13 @@
+import json
+import time
 import requests
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BOLD = lambda x: f"**{x}**"
 MONEY = lambda x: f"${x:,.2f}"
 RED = lambda x: f"<font color='red'>{x}</red>"
@@ -11,9 +18,19 @@ HREF = lambda x, link: f"[{x}]({link})"
 HORIZONTAL_LINE_ELEMENT = {"tag": "hr"}
 
 
+def dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(
+        data, allow_nan=False, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
 class LarkClient:
     def __init__(self, key):
         self.url = "https://open.larksuite.com/open-apis/bot/v2/hook/{}".format(key)
+        self.payload_size = 0
+        self.encode_time = 0.0
 
     def send_message(self, msg):
         resp = requests.post(
@@ -39,7 +56,15 @@ class LarkClient:
         data = {"msg_type": "interactive", "card": {"elements": elements}}
         if header:
             data["card"]["header"] = header
-        resp = requests.post(url=self.url, json=data)
+        start = time.perf_counter()
+        payload = dumps(data)
+        self.encode_time = time.perf_counter() - start
+        self.payload_size = len(payload)
+        resp = requests.post(
+            url=self.url,
+            data=payload,
+            headers={"Content-Type": "application/json"},
+        )
         return resp
 
     @staticmethod